@@ -15,13 +15,38 @@ def Y_array():
     return np.random.random((1000, 2))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def X_array_int_cols():
     # 100 x 12 array
     return np.array([[ii] * 100 for ii in range(12)]).T
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def Y_array_int_cols():
     # 100 x 3 array
     return np.array([[ii] * 100 for ii in range(3)]).T
+
+
+@pytest.fixture(scope="session")
+def int_cols_data_dir(tmp_path_factory, X_array_int_cols, Y_array_int_cols):
+    """Saves the dummy int-column data to disk once per test session. The
+    .npy header is written once and the payload is copied directly into a
+    memory-mapped region of the file. The validation and testing splits are
+    the first 20 and 30 rows of the training data, respectively."""
+
+    d = tmp_path_factory.mktemp("int_cols")
+    for name, arr in [
+        ("X_train.npy", X_array_int_cols),
+        ("X_val.npy", X_array_int_cols[:20]),
+        ("X_test.npy", X_array_int_cols[:30]),
+        ("Y_train.npy", Y_array_int_cols),
+        ("Y_val.npy", Y_array_int_cols[:20]),
+        ("Y_test.npy", Y_array_int_cols[:30]),
+    ]:
+        fp = np.lib.format.open_memmap(
+            d / name, mode="w+", dtype=arr.dtype, shape=arr.shape
+        )
+        fp[:] = arr
+        fp.flush()
+        del fp
+    return str(d)
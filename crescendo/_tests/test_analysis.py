@@ -0,0 +1,57 @@
+import numpy as np
+import torch
+
+from crescendo.analysis import Ensemble, Estimator
+from crescendo.data.array import ArrayRegressionDataModule
+
+
+def _get_estimator(data_dir, normalize_inputs):
+    datamodule = ArrayRegressionDataModule(
+        data_dir=data_dir,
+        normalize_inputs=normalize_inputs,
+        feature_select=None,
+        ensemble_split={"enable": False},
+        dataloader_kwargs={"batch_size": 64, "num_workers": 0},
+        production_mode=False,
+    )
+    estimator = Estimator("unused", verbose=False)
+
+    # Stand in for the results directory, so that no checkpoint is needed;
+    # the identity model returns exactly what it is fed
+    estimator.__dict__["config"] = {
+        "model": {"_target_": "crescendo.models.mlp.MultilayerPerceptron"}
+    }
+    estimator.get_model = lambda: torch.nn.Identity()
+    estimator.get_datamodule = lambda: datamodule
+    return estimator
+
+
+def test_Estimator_predict_scale_forward(int_cols_data_dir):
+    estimator = _get_estimator(int_cols_data_dir, normalize_inputs=True)
+    x = estimator.X_test
+    scaler = estimator.get_datamodule()._X_scaler
+
+    assert np.allclose(estimator.predict(x), x)
+    assert np.allclose(
+        estimator.predict(x, scale_forward=True), scaler.transform(x)
+    )
+
+    # Without an X-scaler, scale_forward is a no-op
+    estimator = _get_estimator(int_cols_data_dir, normalize_inputs=False)
+    assert np.allclose(estimator.predict(x, scale_forward=True), x)
+
+
+def test_Ensemble_predict_scales_inputs(int_cols_data_dir):
+    estimators = [
+        _get_estimator(int_cols_data_dir, normalize_inputs=True),
+        _get_estimator(int_cols_data_dir, normalize_inputs=False),
+    ]
+    ensemble = Ensemble([], verbose=False)
+    ensemble.__dict__["estimators"] = estimators
+    x = estimators[0].X_test
+    preds = ensemble.predict(x)
+
+    assert preds.shape == (2, *x.shape)
+    scaler = estimators[0].get_datamodule()._X_scaler
+    assert np.allclose(preds[0], scaler.transform(x))
+    assert np.allclose(preds[1], x)
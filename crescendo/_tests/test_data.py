@@ -1,52 +1,54 @@
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
 import numpy as np
+import pytest
 
 from crescendo.data.array import ArrayRegressionDataModule
 
 
+def _get_datamodule(data_dir, feature_select, production_mode=False):
+    return ArrayRegressionDataModule(
+        data_dir=data_dir,
+        normalize_inputs=False,
+        feature_select=feature_select,
+        ensemble_split={"enable": False},
+        dataloader_kwargs={
+            "batch_size": 64,
+            "num_workers": 0,
+            "pin_memory": False,
+            "drop_last": True,
+        },
+        production_mode=production_mode,
+    )
+
+
 class TestArrayRegressionDataModule:
-    def test_ArrayRegressionDataModule(
-        self, X_array_int_cols, Y_array_int_cols
+    def test_ArrayRegressionDataModule(self, int_cols_data_dir):
+        datamodule = _get_datamodule(int_cols_data_dir, "0:5")
+        assert datamodule.X_train.shape[1] == 5
+        assert np.array_equal(datamodule.X_train[0], np.arange(5))
+
+        datamodule = _get_datamodule(int_cols_data_dir, "0:3,6:9")
+        assert datamodule.X_train.shape[1] == 6
+        vals = np.array([0, 1, 2, 6, 7, 8])
+        assert np.array_equal(datamodule.X_train[0], vals)
+
+    def test_ArrayRegressionDataModule_production_mode(
+        self, int_cols_data_dir
+    ):
+        datamodule = _get_datamodule(
+            int_cols_data_dir, "0:3,6:9", production_mode=True
+        )
+
+        # Training, validation and testing data are combined row-wise, with
+        # the feature selection applied to all of them
+        assert datamodule.X_train.shape == (100 + 20 + 30, 6)
+        assert datamodule.Y_train.shape == (100 + 20 + 30, 3)
+        vals = np.array([0, 1, 2, 6, 7, 8])
+        assert np.all(datamodule.X_train == vals)
+
+    @pytest.mark.parametrize("feature_select", ["3", "0:9:2", "0:3,a:9"])
+    def test_ArrayRegressionDataModule_invalid_feature_select(
+        self, int_cols_data_dir, feature_select
     ):
-        # Save the dummy data to disk
-        with TemporaryDirectory() as d:
-            np.save(str(Path(d) / "X_train.npy"), X_array_int_cols)
-            np.save(str(Path(d) / "Y_train.npy"), Y_array_int_cols)
-
-            datamodule = ArrayRegressionDataModule(
-                data_dir=d,
-                normalize_inputs=False,
-                feature_select="0:5",
-                ensemble_split={"enable": False},
-                dataloader_kwargs={
-                    "batch_size": 64,
-                    "num_workers": 0,
-                    "pin_memory": False,
-                    "drop_last": True,
-                },
-                production_mode=False,
-            )
-            assert datamodule.X_train.shape[1] == 5
-            for ii, column in enumerate(datamodule.X_train.T):
-                assert column[0] == ii
-
-            datamodule = ArrayRegressionDataModule(
-                data_dir=d,
-                normalize_inputs=False,
-                feature_select="0:3,6:9",
-                ensemble_split={"enable": False},
-                dataloader_kwargs={
-                    "batch_size": 64,
-                    "num_workers": 0,
-                    "pin_memory": False,
-                    "drop_last": True,
-                },
-                production_mode=False,
-            )
-
-            assert datamodule.X_train.shape[1] == 6
-            vals = [0, 1, 2, 6, 7, 8]
-            for ii, column in enumerate(datamodule.X_train.T):
-                assert column[0] == vals[ii]
+        datamodule = _get_datamodule(int_cols_data_dir, feature_select)
+        with pytest.raises(ValueError, match="Invalid feature_select"):
+            datamodule.X_train
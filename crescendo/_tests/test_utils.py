@@ -0,0 +1,20 @@
+from crescendo.utils.other_utils import remove_files_matching_patterns
+
+
+def test_remove_files_matching_patterns(tmp_path):
+    for name in ["a.log", "b.log", "c.txt"]:
+        (tmp_path / name).touch()
+
+    # Subdirectories, and anything inside them, are left alone even if they
+    # match the pattern
+    subdir = tmp_path / "sub.log"
+    subdir.mkdir()
+    (subdir / "d.log").touch()
+
+    remove_files_matching_patterns(directory=tmp_path, pattern="*.log")
+
+    assert not (tmp_path / "a.log").exists()
+    assert not (tmp_path / "b.log").exists()
+    assert (tmp_path / "c.txt").exists()
+    assert subdir.is_dir()
+    assert (subdir / "d.log").exists()
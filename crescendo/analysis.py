@@ -24,7 +24,8 @@ class Estimator:
         """Loads and returns the .hydra/config.yaml file as a dictionary."""
 
         path = Path(self._results_dir) / ".hydra" / "config.yaml"
-        d = safe_load(open(path, "r"))
+        with open(path, "r") as f:
+            d = safe_load(f)
         if self._verbose:
             print(f"Loaded config.yaml from {path}")
         return d
@@ -34,7 +35,8 @@ class Estimator:
         """Loads and returns the .hydra/hydra.yaml file as a dictionary."""
 
         path = Path(self._results_dir) / ".hydra" / "hydra.yaml"
-        d = safe_load(open(path, "r"))
+        with open(path, "r") as f:
+            d = safe_load(f)
         if self._verbose:
             print(f"Loaded hydra.yaml from {path}")
         return d
@@ -44,7 +46,8 @@ class Estimator:
         """Loads and returns the .hydra/overrides.yaml file as a list."""
 
         path = Path(self._results_dir) / ".hydra" / "overrides.yaml"
-        d = safe_load(open(path, "r"))
+        with open(path, "r") as f:
+            d = safe_load(f)
         if self._verbose:
             print(f"Loaded overrides.yaml from {path}")
         return d
@@ -117,7 +120,7 @@ class Estimator:
     def get_model(self, checkpoint=None):
         """Loads the model from the provided checkpoint file. If None, it will
         attempt to load the model from a checkpoint matching the signature
-        best-v1.ckpt.
+        best-v1.ckpt. The model is returned in evaluation mode.
 
         Parameters
         ----------
@@ -133,7 +136,9 @@ class Estimator:
         if checkpoint is None:
             checkpoint = self.best_checkpoint
 
-        return utils.instantiate_model(self.config, checkpoint=checkpoint)
+        model = utils.instantiate_model(self.config, checkpoint=checkpoint)
+        model.eval()
+        return model
 
     @cache
     def get_datamodule(self):
@@ -209,11 +214,17 @@ class Estimator:
 
     @staticmethod
     def _predict_dnn(model, x):
-        x = torch.Tensor(x).float()
-        with torch.no_grad():
-            return model.forward(x).detach().numpy()
-
-    def predict(self, x):
+        # Share memory with x where possible. Read-only float32 inputs (e.g.
+        # memory-mapped data) are copied, since torch.from_numpy warns on
+        # non-writable arrays and writes through the tensor are undefined
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        if not x.flags.writeable:
+            x = x.copy()
+        x = torch.from_numpy(x)
+        with torch.inference_mode():
+            return model.forward(x).cpu().numpy()
+
+    def predict(self, x, scale_forward=False):
         """Runs forward prediction on the model.
 
         Parameters
@@ -223,6 +234,10 @@ class Estimator:
             array, or list of objects. For example, in the case of the MLPs,
             x is a numpy array. However, for MPNNs, it is a list of DGL graph
             objects.
+        scale_forward : bool, optional
+            If True, x is assumed to be unscaled, and is transformed by the
+            datamodule's X-scaler (if enabled) before being passed to the
+            model. Otherwise, x is passed to the model as is.
 
         Returns
         -------
@@ -237,7 +252,11 @@ class Estimator:
         model_type = self.config["model"]["_target_"]
 
         model = self.get_model()
-        model.eval()
+
+        if scale_forward:
+            scaler = self.get_datamodule()._X_scaler
+            if scaler is not None:
+                x = scaler.transform(x)
 
         if "crescendo.models.mlp" in model_type:
             return self._predict_dnn(model, x)
@@ -362,18 +381,21 @@ class HPTunedSet(ModelSet, EnsembleValTestMixin):
             Description
         """
 
-        if metric is None:
-
-            def metric(pred, truth):
-                return np.mean((pred - truth) ** 2)
-
         if X is None:
             X = self.X_val
         if Y is None:
             Y = self.Y_val
 
         preds = [est.predict(X) for est in self.estimators]
-        results = [metric(pred, Y) for pred in preds]
+
+        if metric is None:
+            # Default is the MSE, computed for all estimators at once
+            preds = np.stack(preds)
+            axes = tuple(range(1, preds.ndim))
+            results = np.mean((preds - Y) ** 2, axis=axes)
+        else:
+            results = [metric(pred, Y) for pred in preds]
+
         argmin = np.argmin(results)
         return self.estimators[argmin], results[argmin]
 
@@ -391,16 +413,14 @@ class Ensemble(ModelSet, EnsembleValTestMixin):
         Parameters
         ----------
         x : numpy.ndarray
-            Assumed to be unscaled.
+            Assumed to be unscaled. Each estimator applies its own X-scaler
+            before running the model.
 
         Returns
         -------
         numpy.ndarray
         """
 
-        x = torch.Tensor(x).float()
-
-        # Ignore the standard output
-        return np.array(
+        return np.stack(
             [est.predict(x, scale_forward=True) for est in self.estimators]
         )
@@ -15,7 +15,20 @@ from crescendo import logger
 
 @cache
 def read_numpy_array_from_disk(path):
-    return np.load(path)
+    """Reads a .npy file from disk as a read-only memory map. Only the header
+    is parsed up front; the array itself is a view into the mapped file, and
+    pages are read from disk on demand.
+
+    Parameters
+    ----------
+    path : os.PathLike
+
+    Returns
+    -------
+    numpy.memmap
+    """
+
+    return np.load(path, mmap_mode="r")
 
 
 @cache
@@ -53,6 +66,45 @@ def _ensemble_split(
     return [train_indexes for (train_indexes, _) in kf.split(L)][split_index]
 
 
+@cache
+def _parse_feature_select(feature_select):
+    """Parses the feature selection string into a tuple of column slices.
+    For example, ``"0:3,6:9"`` becomes ``(slice(0, 3), slice(6, 9))``. As
+    with any slice, an upper bound past the width of the data is clamped.
+
+    Parameters
+    ----------
+    feature_select : str
+
+    Returns
+    -------
+    tuple
+
+    Raises
+    ------
+    ValueError
+        If any comma-separated entry is not of the form ``start:stop`` with
+        integer ``start`` and ``stop``.
+    """
+
+    slices = []
+
+    # First, split by the comma separation, then for each entry, we split by
+    # the second delimiter, a :
+    for xx in feature_select.split(","):
+        try:
+            start, stop = [int(ii) for ii in xx.split(":")]
+        except ValueError:
+            raise ValueError(
+                f"Invalid feature_select entry '{xx}' in '{feature_select}'. "
+                "Each comma-separated entry must be of the form start:stop, "
+                "e.g. feature_select=\"0:200,400:600\""
+            )
+        slices.append(slice(start, stop))
+
+    return tuple(slices)
+
+
 def check_batch_size(L_set, batch_size):
     """There are some bugs (https://stackoverflow.com/a/49035538) that occur
     when you attempt to use set sizes that are (significantly?) smaller than
@@ -124,24 +176,27 @@ class XYArrayPropertyMixin:
 
     def _apply_feature_selection_logic(self, data):
         """Runs the feature selection logic on the data based on the provided
-        value of self.hparams.feature_select."""
+        value of self.hparams.feature_select. This is applied before any
+        other processing, so that subsequent copies (e.g. concatenation or
+        downsampling) only involve the selected columns. Note that for
+        memory-mapped data, the pages read from disk still depend on the
+        layout of the file, and will generally include unselected columns."""
 
         if self.hparams.feature_select is None:
             return data
 
-        # First, split by the comma separation
-        split = self.hparams.feature_select.split(",")
-
-        # For each entry, we split by the second delimiter, a :
-        split = [np.array(xx.split(":")).astype(int).tolist() for xx in split]
-        logger.warning(f"Applying feature selection logic: {split}")
+        slices = _parse_feature_select(self.hparams.feature_select)
+        logger.warning(
+            "Applying feature selection logic: "
+            f"{self.hparams.feature_select}"
+        )
 
-        # Edge case
-        if len(split) == 1:
-            return data[:, split[0][0] : split[0][1]]
+        # Edge case: a single slice is just a view
+        if len(slices) == 1:
+            return data[:, slices[0]]
 
         # Otherwise we iterate through the splits and concatenate
-        return np.concatenate([data[:, s[0] : s[1]] for s in split], axis=1)
+        return np.concatenate([data[:, s] for s in slices], axis=1)
 
     def _load_data(self, property_name):
         # Attempt to load from disk
@@ -162,10 +217,11 @@ class XYArrayPropertyMixin:
     @cached_property
     def X_train(self):
         dat = self._load_data("X_train")
+        dat = self._apply_feature_selection_logic(dat)
         if self.hparams.production_mode:
+            # X_val and X_test already have the feature selection applied
             dat = np.concatenate([dat, self.X_val, self.X_test], axis=0)
-        dat = self._apply_ensemble_split(dat)
-        return self._apply_feature_selection_logic(dat)
+        return self._apply_ensemble_split(dat)
 
     @cached_property
     def X_val(self):
@@ -220,52 +276,68 @@ class ScaleXMixin:
             raise ValueError("X-scaler is disabled")
         return self._X_scaler.transform(self.X_test)
 
-    def _setup_X_scaler(self):
-        """
+    @cached_property
+    def _X_scaler(self):
+        """The StandardScaler fit on the training data, or None if
+        self.hparams.normalize_inputs is False. This is fit lazily on first
+        access, so that constructing the datamodule does not require loading
+        the training data.
 
-        Parameters
-        ----------
-        stage : Optional[str], optional
-            Description
+        Returns
+        -------
+        sklearn.preprocessing.StandardScaler or None
         """
 
-        if self.hparams.normalize_inputs:
-            self._X_scaler = StandardScaler()
-            self._X_scaler.fit(self.X_train)
-        else:
-            self._X_scaler = None
+        if not self.hparams.normalize_inputs:
+            return None
+        scaler = StandardScaler()
+        scaler.fit(self.X_train)
+        return scaler
 
 
 class DataLoaderMixin:
-    def train_dataloader(self):
-        X = self.X_train.copy()
-        check_batch_size(len(X), self.hparams.dataloader_kwargs["batch_size"])
+    @property
+    def _dataloader_kwargs(self):
+        """The keyword arguments passed to every dataloader. Options that are
+        only valid with worker processes (``persistent_workers`` and
+        ``prefetch_factor``) are dropped when ``num_workers`` is 0, since
+        PyTorch raises otherwise. This allows them to be set in the default
+        config regardless of the number of workers. If ``pin_memory`` is
+        None, batches are pinned whenever CUDA is available, so that
+        host-to-device copies can be made asynchronously.
+
+        Returns
+        -------
+        dict
+        """
+
+        kwargs = dict(self.hparams.dataloader_kwargs)
+        if kwargs.get("pin_memory") is None:
+            kwargs["pin_memory"] = torch.cuda.is_available()
+        if kwargs.get("num_workers", 0) == 0:
+            kwargs.pop("persistent_workers", None)
+            kwargs.pop("prefetch_factor", None)
+        return kwargs
+
+    def _get_dataloader(self, split):
+        """Builds the dataloader for the provided split, one of ``train``,
+        ``val`` or ``test``, scaling the inputs if the X-scaler is enabled."""
+
+        kwargs = self._dataloader_kwargs
+        X = getattr(self, f"X_{split}")
+        check_batch_size(len(X), kwargs["batch_size"])
         if self._X_scaler is not None:
             X = self._X_scaler.transform(X)
-        X = torch.tensor(X).float()
-        Y = torch.tensor(self.Y_train.copy()).float()
-        return DataLoader(
-            TensorDataset(X, Y), **self.hparams.dataloader_kwargs
-        )
+        X = torch.from_numpy(np.array(X, dtype=np.float32))
+        Y = getattr(self, f"Y_{split}")
+        Y = torch.from_numpy(np.array(Y, dtype=np.float32))
+        return DataLoader(TensorDataset(X, Y), **kwargs)
+
+    def train_dataloader(self):
+        return self._get_dataloader("train")
 
     def val_dataloader(self):
-        X = self.X_val.copy()
-        check_batch_size(len(X), self.hparams.dataloader_kwargs["batch_size"])
-        if self._X_scaler is not None:
-            X = self._X_scaler.transform(X)
-        X = torch.tensor(X).float()
-        Y = torch.tensor(self.Y_val.copy()).float()
-        return DataLoader(
-            TensorDataset(X, Y), **self.hparams.dataloader_kwargs
-        )
+        return self._get_dataloader("val")
 
     def test_dataloader(self):
-        X = self.X_test.copy()
-        check_batch_size(len(X), self.hparams.dataloader_kwargs["batch_size"])
-        if self._X_scaler is not None:
-            X = self._X_scaler.transform(X)
-        X = torch.tensor(X).float()
-        Y = torch.tensor(self.Y_test.copy()).float()
-        return DataLoader(
-            TensorDataset(X, Y), **self.hparams.dataloader_kwargs
-        )
+        return self._get_dataloader("test")
@@ -1,13 +1,9 @@
 """Container for various LightningDataModules used for vector-to-vector
 predictions."""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
 from lightning import LightningDataModule
-import numpy as np
 
-from crescendo.utils.datasets import download_california_housing_data
+from crescendo.utils.datasets import get_california_housing_data
 from crescendo.data._common import (
     XYArrayPropertyMixin,
     ScaleXMixin,
@@ -37,6 +33,14 @@ class ArrayRegressionDataModule(
     See the documentation for further reference
     https://lightning.ai/docs/pytorch/latest/data/datamodule.html
 
+    Data is read from disk as read-only memory maps (``numpy.memmap``), which
+    are shared between all datamodules loading the same file. ``X_train``,
+    ``Y_val``, etc. are therefore read-only views whenever no copy is made.
+    Whether a copy is made depends on the config: ``feature_select`` with
+    more than one range, ``ensemble_split`` and ``production_mode`` all
+    produce new, writable arrays, while otherwise the arrays are read-only.
+    Call ``.copy()`` before modifying them in place.
+
     Properties
     ----------
     data_dir : os.PathLike
@@ -70,7 +74,6 @@ class ArrayRegressionDataModule(
     ):
         super().__init__()
         self.save_hyperparameters(logger=False)
-        self._setup_X_scaler()
         if self.hparams.production_mode:
             logger.warning(
                 "Production mode is set to True. Validation and testing data "
@@ -92,18 +95,15 @@ class CaliforniaHousingDataset(
         super().__init__()
         self.hparams.data_dir = None
         self.save_hyperparameters(logger=False)
-        with TemporaryDirectory() as t:
-            path = t / Path("california_housing_data")
-            download_california_housing_data(path)
-            self._X_train = np.load(path / "X_train.npy")
-            self._X_val = np.load(path / "X_val.npy")
-            self._X_test = np.load(path / "X_test.npy")
-            self._Y_train = np.load(path / "Y_train.npy")
-            self._Y_val = np.load(path / "Y_val.npy")
-            self._Y_test = np.load(path / "Y_test.npy")
+        data = get_california_housing_data()
+        self._X_train = data["X_train"]
+        self._X_val = data["X_val"]
+        self._X_test = data["X_test"]
+        self._Y_train = data["Y_train"]
+        self._Y_val = data["Y_val"]
+        self._Y_test = data["Y_test"]
         if self.hparams.production_mode:
             logger.warning(
                 "Production mode is set to True. Validation and testing data "
                 "will be combined with training data during model fitting."
             )
-        self._setup_X_scaler()
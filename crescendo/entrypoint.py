@@ -226,10 +226,9 @@ def _tune_cleanup(cache):
 
     optimization_results = utils.read_yaml(p)
 
-    res = [(key, value) for key, value in d["validation_results"].items()]
-    res.sort(key=lambda xx: xx[1])
-
-    best_result = res[0][0]  # Get the directory
+    # Get the directory with the lowest validation score
+    validation_results = d["validation_results"]
+    best_result = min(validation_results, key=validation_results.get)
 
     optimization_results["best_model"] = best_result
 
@@ -251,7 +251,7 @@ class MultilayerPerceptron(LightningModule):
 
     def test_step(self, batch, batch_idx):
         loss, ypred, y = self.model_step(batch)
-        self.val_loss(loss)
+        self.test_loss(loss)
         self.log(
             "test/loss",
             self.test_loss,
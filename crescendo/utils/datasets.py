@@ -1,14 +1,31 @@
+from functools import cache
 from pathlib import Path
 
 import numpy as np
-from sklearn.datasets import fetch_california_housing
 from sklearn.model_selection import train_test_split
 
 
-def download_california_housing_data(path, random_state=1234):
-    path = Path(path)
-    if not path.exists():
-        path.mkdir()
+@cache
+def get_california_housing_data(random_state=1234):
+    """Fetches the California housing data and splits it into training,
+    validation and testing sets. The result is cached, so repeated calls in
+    the same process do not refetch or resplit the data.
+
+    Parameters
+    ----------
+    random_state : int, optional
+        The random state used for the splits.
+
+    Returns
+    -------
+    dict
+        Read-only arrays keyed by ``X_train``, ``Y_val``, etc. Targets have
+        shape ``(N, 1)``.
+    """
+
+    # sklearn.datasets is only needed here, so avoid importing it whenever
+    # crescendo.data is imported
+    from sklearn.datasets import fetch_california_housing
 
     housing = fetch_california_housing()
 
@@ -25,9 +42,24 @@ def download_california_housing_data(path, random_state=1234):
         random_state=random_state,
     )
 
-    np.save(path / "X_train.npy", X_train)
-    np.save(path / "X_val.npy", X_val)
-    np.save(path / "X_test.npy", X_test)
-    np.save(path / "Y_train.npy", Y_train.reshape(-1, 1))
-    np.save(path / "Y_val.npy", Y_val.reshape(-1, 1))
-    np.save(path / "Y_test.npy", Y_test.reshape(-1, 1))
+    data = {
+        "X_train": X_train,
+        "X_val": X_val,
+        "X_test": X_test,
+        "Y_train": Y_train.reshape(-1, 1),
+        "Y_val": Y_val.reshape(-1, 1),
+        "Y_test": Y_test.reshape(-1, 1),
+    }
+    for arr in data.values():
+        arr.setflags(write=False)
+    return data
+
+
+def download_california_housing_data(path, random_state=1234):
+    path = Path(path)
+    if not path.exists():
+        path.mkdir()
+
+    data = get_california_housing_data(random_state=random_state)
+    for key, arr in data.items():
+        np.save(path / f"{key}.npy", arr)
@@ -46,16 +46,21 @@ def instantiate_datamodule(config):
 
 
 def instantiate_model(config, checkpoint=None):
-    model = hydra.utils.instantiate(config.model)
-    logger.debug(f"Model instantiated {model.__class__}")
-    if checkpoint is not None:
-        try:
-            model = model.__class__.load_from_checkpoint(checkpoint)
-        except RuntimeError:
-            model = model.__class__.load_from_checkpoint(
-                checkpoint, map_location=torch.device("cpu")
-            )
-        logger.debug(f"Model loaded from checkpoint {checkpoint}")
+    if checkpoint is None:
+        model = hydra.utils.instantiate(config.model)
+        logger.debug(f"Model instantiated {model.__class__}")
+        return model
+
+    # The checkpoint restores the hyperparameters and weights itself, so only
+    # the class is needed; there's no point building a fresh model first
+    klass = hydra.utils.get_class(config.model["_target_"])
+    try:
+        model = klass.load_from_checkpoint(checkpoint)
+    except RuntimeError:
+        model = klass.load_from_checkpoint(
+            checkpoint, map_location=torch.device("cpu")
+        )
+    logger.debug(f"Model {klass} loaded from checkpoint {checkpoint}")
     return model
 
 
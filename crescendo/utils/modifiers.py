@@ -25,6 +25,26 @@ def seed_everything(config):
         logger.success(f"{LOGGER_PREFIX} Config seed set: {config.seed}")
 
 
+def _linear_ramp(n_in, n_out, n_interior):
+    """Returns the sizes of n_interior hidden layers evenly spaced on the
+    line between n_in and n_out, excluding the endpoints themselves. For
+    example, ``_linear_ramp(10, 2, 3)`` is ``[8.0, 6.0, 4.0]``.
+
+    Parameters
+    ----------
+    n_in : int
+    n_out : int
+    n_interior : int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    x = np.arange(1, n_interior + 1)
+    return n_in + (n_out - n_in) * x / (n_interior + 1)
+
+
 def _update_architecture_linear_ramp_(config, input_dims_key, output_dims_key):
     """If config.model["architecture"] is an integer, assumes a linear ramp
     between the input and output layers, with the integer providing the number
@@ -38,10 +58,7 @@ def _update_architecture_linear_ramp_(config, input_dims_key, output_dims_key):
     n_interior = config.model["architecture"]
 
     # Now we interpolate
-    x = [0, n_interior + 1]
-    y = [n_in, n_out]
-    x_eval = np.linspace(1, n_interior, n_interior)
-    y_interp = np.interp(x_eval, x, y).astype(int).tolist()
+    y_interp = _linear_ramp(n_in, n_out, n_interior).astype(int).tolist()
 
     config.model["architecture"] = y_interp
     logger.success(
@@ -96,8 +113,12 @@ def _update_architecture_(config, input_dims_key, output_dims_key):
             "architecture initialization"
         )
 
-    # Otherwise, we do our magic. Note that the random state should've been
-    # provided earlier (via ``seed_everything``)
+    # Otherwise, we do our magic. The architecture draws use their own
+    # generator seeded from the config, so they do not depend on (or advance)
+    # the global random state. A negative seed means unseeded, as in
+    # ``seed_everything``
+    seed = config.seed if config.seed > -1 else None
+    rng = np.random.default_rng(seed)
     neurons_range = config.model["architecture"]["neurons_range"]
     ramp_std = config.model["architecture"]["ramp_std"]
 
@@ -106,25 +127,22 @@ def _update_architecture_(config, input_dims_key, output_dims_key):
     n_out = config.model[output_dims_key]
 
     # Make a random choice of the number of interior neurons
-    n_interior = np.random.randint(
-        low=neurons_range[0], high=neurons_range[1] + 1
+    n_interior = int(
+        rng.integers(low=neurons_range[0], high=neurons_range[1] + 1)
     )
 
     # Now we interpolate
-    x = [0, n_interior + 1]
-    y = [n_in, n_out]
-    x_eval = np.linspace(1, n_interior, n_interior)
-    y_interp = np.interp(x_eval, x, y)
+    y_interp = _linear_ramp(n_in, n_out, n_interior)
     logger.success(
         f"{LOGGER_PREFIX} Using randomized architecture: from parameters "
         f"neurons_range={neurons_range} and ramp_std={ramp_std:.05f}. "
         f"Interior architecture before noise: {y_interp.tolist()}"
     )
 
-    # Add random noise
-    y_interp = y_interp + np.random.normal(scale=ramp_std, size=len(y_interp))
+    # Add random noise, making sure every layer keeps at least one neuron
+    y_interp += rng.normal(scale=ramp_std, size=n_interior)
+    np.clip(y_interp, 1, None, out=y_interp)
     y_interp = y_interp.astype(int)
-    y_interp[y_interp <= 0] = 1
     logger.success(f"{LOGGER_PREFIX} Architecture after noise: {y_interp}")
 
     config.model["architecture"] = y_interp.tolist()
@@ -278,8 +296,15 @@ def compile_model(config, model):
     from torch import _dynamo
 
     _dynamo.config.suppress_errors = True
-    model = torch.compile(model)
+    try:
+        compiled = torch.compile(model)
+    except Exception as err:
+        logger.warning(
+            f"{LOGGER_PREFIX} Model compilation failed ({err}); falling back "
+            "on eager execution"
+        )
+        return model
     logger.warning(
         f"{LOGGER_PREFIX} Model compilation attempted... see logs above"
     )
-    return model
+    return compiled
@@ -1,6 +1,8 @@
 from contextlib import contextmanager
 from filelock import FileLock
+from fnmatch import fnmatch
 import json
+import os
 from pathlib import Path
 from subprocess import Popen, PIPE
 from time import perf_counter
@@ -19,8 +21,10 @@ def remove_files_matching_patterns(directory="./", pattern="*.log"):
     pattern : str, optional
     """
 
-    for p in Path(".").glob("P*.jpg"):
-        p.unlink()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and fnmatch(entry.name, pattern):
+                os.unlink(entry.path)
 
 
 def omegaconf_to_yaml(d, path):
@@ -66,11 +70,14 @@ def read_json(path):
 
 
 def save_yaml(d, path):
-    yaml.dump(d, open(path, "w"))
+    with open(path, "w") as outfile:
+        yaml.dump(d, outfile)
 
 
 def read_yaml(path):
-    return yaml.safe_load(open(path, "r"))
+    with open(path, "r") as infile:
+        dat = yaml.safe_load(infile)
+    return dat
 
 
 class GlobalCache: